@@ -10,14 +10,15 @@ interface RadicalIndex {
   [radical: string]: string[];
 }
 
+// Number of SVG files read concurrently while building the index
+const READ_CONCURRENCY = 64;
+
 /**
- * Parse SVG file to extract radicals.
+ * Parse SVG content to extract radicals.
  * Priority: "general" first, fallback to "tradit" if no "general" found.
  * The displayed radical character is taken from the group's kvg:element.
  */
-function parseSVGForRadicals(filePath: string, character: string): string[] {
-  const svgContent = fs.readFileSync(filePath, 'utf8');
-
+function parseSVGForRadicals(svgContent: string, character: string): string[] {
   // Find <g ... kvg:radical="..." ...> tags and capture their kvg:element values
   const groupRegex = /<g\b[^>]*kvg:radical="([^"]+)"[^>]*>/g;
   const elementAttrRegex = /kvg:element="([^"]+)"/;
@@ -67,48 +68,69 @@ async function buildRadicalIndex() {
     fs.readFileSync(indexFile, 'utf8')
   );
   
+  // List the kanji directory once instead of stat-ing every file
+  const svgFiles = new Set<string>(
+    fs.readdirSync(kanjiDir, { withFileTypes: true })
+      .filter((entry: any) => entry.isFile() && entry.name.endsWith('.svg'))
+      .map((entry: any) => entry.name)
+  );
+
   const radicalIndex: RadicalIndex = {};
   let processedCount = 0;
   
-  // Process each kanji
-  for (const [character, files] of Object.entries(index)) {
-    const baseFile = files[0]; // Get the base (non-variant) file
-    const filePath = path.join(kanjiDir, baseFile);
-    
-    if (!fs.existsSync(filePath)) {
-      continue;
-    }
-    
-    try {
-      // Parse the SVG to extract radicals
-      const radicals = parseSVGForRadicals(filePath, character);
-      
-      // Add to radical index
-      for (const radical of radicals) {
-        if (!radicalIndex[radical]) {
-          radicalIndex[radical] = [];
+  // Process kanji in batches: the SVG reads of a batch are issued in parallel,
+  // then parsed in index order so the output stays deterministic
+  const entries = Object.entries(index);
+  for (let start = 0; start < entries.length; start += READ_CONCURRENCY) {
+    const batch = entries
+      .slice(start, start + READ_CONCURRENCY)
+      .filter(([, files]) => svgFiles.has(files[0])) // Get the base (non-variant) file
+      .map(([character, files]) => ({
+        character,
+        filePath: path.join(kanjiDir, files[0]),
+      }));
+
+    const contents = await Promise.allSettled(
+      batch.map(({ filePath }) => fs.promises.readFile(filePath, 'utf8'))
+    );
+
+    for (let i = 0; i < batch.length; i++) {
+      const { character, filePath } = batch[i];
+      const content = contents[i];
+
+      try {
+        if (content.status === 'rejected') {
+          throw content.reason;
         }
+
+        // Parse the SVG to extract radicals
+        const radicals = parseSVGForRadicals(content.value, character);
         
-        // Add the character if not already present
-        if (!radicalIndex[radical].includes(character)) {
-          radicalIndex[radical].push(character);
+        // Add to radical index. Index keys are unique and radicals are
+        // deduplicated per character, so no membership check is needed
+        for (const radical of radicals) {
+          let characters = radicalIndex[radical];
+          if (!characters) {
+            characters = radicalIndex[radical] = [];
+          }
+          characters.push(character);
         }
+        
+        processedCount++;
+        
+        if (processedCount % 100 === 0) {
+          console.log(`Processed ${processedCount} kanji...`);
+        }
+      } catch (error) {
+        console.error(`Error processing ${filePath}:`, error);
       }
-      
-      processedCount++;
-      
-      if (processedCount % 100 === 0) {
-        console.log(`Processed ${processedCount} kanji...`);
-      }
-    } catch (error) {
-      console.error(`Error processing ${filePath}:`, error);
     }
   }
   
-  // Write the radical index
+  // Write the radical index (compact: it is fetched as-is by browser builds)
   fs.writeFileSync(
     outputFile,
-    JSON.stringify(radicalIndex, null, 2),
+    JSON.stringify(radicalIndex),
     'utf8'
   );
   
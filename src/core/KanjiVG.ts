@@ -14,6 +14,7 @@ const IS_BROWSER: boolean = (typeof __BROWSER__ !== 'undefined')
 export class KanjiVG {
   private parser: SVGParser;
   private index: Map<string, string[]>; // character -> file list
+  private indexCharacters: string[] | null = null; // index keys, built on first getRandom
   private radicalIndex: Map<string, string[]>; // radical -> character list
   private indexLoaded: boolean = false;
   private radicalIndexLoaded: boolean = false;
@@ -56,6 +57,7 @@ export class KanjiVG {
       
       // Convert to Map structure
       this.index = new Map(Object.entries(indexData));
+      this.indexCharacters = null;
       this.indexLoaded = true;
     } catch (error) {
       throw new KanjiVGError(
@@ -70,6 +72,7 @@ export class KanjiVG {
    */
   setIndex(index: Map<string, string[]>): void {
     this.index = index;
+    this.indexCharacters = null;
     this.indexLoaded = true;
   }
 
@@ -187,7 +190,11 @@ export class KanjiVG {
       await this.initialize();
     }
 
-    const chars = Array.from(this.index.keys());
+    // Copy the index keys once rather than on every call
+    if (!this.indexCharacters) {
+      this.indexCharacters = Array.from(this.index.keys());
+    }
+    const chars = this.indexCharacters;
     if (chars.length === 0) {
       throw new KanjiVGError(
         'No kanji available',
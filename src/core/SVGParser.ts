@@ -13,10 +13,11 @@ export class SVGParser {
    * @returns Parsed KanjiData object
    */
   parseSVG(svgContent: string, unicode: string): KanjiData {
-    // Check cache first
+    // Check cache first (single lookup)
     const cacheKey = unicode;
-    if (this.cache.has(cacheKey)) {
-      return this.cache.get(cacheKey)!;
+    const cached = this.cache.get(cacheKey);
+    if (cached) {
+      return cached;
     }
 
     // Preprocess SVG: Strip DOCTYPE (which can cause parsing issues in some environments)
@@ -48,24 +49,29 @@ export class SVGParser {
     // Extract character
     const character = this.extractCharacter(doc, unicode);
     
+    // Locate the stroke tree once; strokes and groups are both read from it
+    const strokeGroup = doc.querySelector('g[id^="kvg:StrokePaths"]');
+    if (!strokeGroup) {
+      throw new Error('Cannot find StrokePaths group');
+    }
+
     // Extract all strokes in order
-    const strokes = this.extractStrokes(doc);
+    const strokes = this.extractStrokes(strokeGroup);
     
     // Extract group hierarchy
-    const groups = this.extractGroups(doc);
+    const groups = this.extractGroups(strokeGroup);
     
     // Extract radical information
     const radicalInfo = this.extractRadicalInfo(groups, strokes);
     
-    // Mark strokes as radical strokes
-    strokes.forEach(stroke => {
-      stroke.isRadicalStroke = this.isRadicalStroke(stroke, groups);
-      stroke.groupId = this.getStrokeGroupId(stroke.strokeNumber, groups);
-    });
-    
     // Extract stroke number positions
     const numberPositions = this.extractNumberPositions(doc, strokes.length);
+
+    // Annotate strokes with group membership and number positions in one pass
+    const { groupIds, radicalStrokes } = this.indexStrokeGroups(groups);
     strokes.forEach((stroke, index) => {
+      stroke.isRadicalStroke = radicalStrokes.has(stroke.strokeNumber);
+      stroke.groupId = groupIds.get(stroke.strokeNumber);
       if (numberPositions[index]) {
         stroke.numberPosition = numberPositions[index];
       }
@@ -110,30 +116,24 @@ export class SVGParser {
   /**
    * Extract all stroke path elements in order
    */
-  private extractStrokes(doc: Document): StrokeData[] {
-    const strokeGroup = doc.querySelector('g[id^="kvg:StrokePaths"]');
-    if (!strokeGroup) {
-      throw new Error('Cannot find StrokePaths group');
-    }
+  private extractStrokes(strokeGroup: Element): StrokeData[] {
+    const paths = strokeGroup.querySelectorAll('path');
+    const strokes: StrokeData[] = [];
 
-    const paths = Array.from(strokeGroup.querySelectorAll('path')).filter(path => {
+    // Filter and build in one pass; only stroke paths (id "...-sN") are kept
+    for (let i = 0; i < paths.length; i++) {
+      const path = paths[i];
       const id = path.getAttribute('id');
-      return id && id.includes('-s');
-    });
-
-    const strokes: StrokeData[] = [];
-    
-    paths.forEach((path, index) => {
-      const id = path.getAttribute('id') || '';
-      const pathData = path.getAttribute('d') || '';
-      const strokeType = path.getAttribute('kvg:type') || '';
+      if (!id || !id.includes('-s')) {
+        continue;
+      }
 
       strokes.push({
-        strokeNumber: index + 1,
-        path: pathData,
-        strokeType,
+        strokeNumber: strokes.length + 1,
+        path: path.getAttribute('d') || '',
+        strokeType: path.getAttribute('kvg:type') || '',
       });
-    });
+    }
 
     return strokes;
   }
@@ -141,15 +141,17 @@ export class SVGParser {
   /**
    * Extract group hierarchy
    */
-  private extractGroups(doc: Document): GroupData[] {
-    const strokeGroup = doc.querySelector('g[id^="kvg:StrokePaths"]');
-    if (!strokeGroup) {
-      return [];
-    }
-
+  private extractGroups(strokeGroup: Element): GroupData[] {
     const groups: GroupData[] = [];
     const groupElements = Array.from(strokeGroup.querySelectorAll('g'));
 
+    // Stroke numbers follow path order in the document; index the paths once
+    // instead of re-querying and scanning them for every group
+    const pathNumbers = new Map<Element, number>();
+    Array.from(strokeGroup.querySelectorAll('path')).forEach((p, index) => {
+      pathNumbers.set(p, index + 1);
+    });
+
     groupElements.forEach(groupEl => {
       const id = groupEl.getAttribute('id');
       if (!id || !id.includes('-g')) {
@@ -164,47 +166,8 @@ export class SVGParser {
       // CRITICAL: Only get direct child paths, NOT paths from nested radical groups
       // We need to traverse nested position groups (g2, g3) but NOT nested radical groups (g4, etc.)
       // A radical group is identified by having both -g in the id AND a kvg:radical attribute
-      const directChildPaths: Element[] = [];
-      
-      // Recursively find paths that are NOT inside nested radical group elements
-      const collectDirectPaths = (el: Element) => {
-        for (const child of Array.from(el.children)) {
-          if (child.tagName === 'path') {
-            directChildPaths.push(child);
-          } else if (child.tagName === 'g') {
-            // Check if this is a nested radical group (has -g in id AND kvg:radical attribute)
-            // Position groups (like g2, g3) only have kvg:position, not kvg:radical
-            const childId = child.getAttribute('id') || '';
-            const childRadical = child.getAttribute('kvg:radical');
-            
-            if (childId.includes('-g') && childRadical) {
-              // This is a nested radical group - stop here, don't include its paths
-              // Paths inside nested radical groups belong to those groups, not this one
-            } else {
-              // This is a position group or other non-radical group - continue traversing
-              collectDirectPaths(child);
-            }
-          } else {
-            // Other element types, continue traversing
-            collectDirectPaths(child);
-          }
-        }
-      };
-      
-      collectDirectPaths(groupEl);
-      
       const childStrokes: number[] = [];
-      
-      // Determine stroke numbers based on path order in the document
-      const allPaths = Array.from(strokeGroup.querySelectorAll('path'));
-      directChildPaths.forEach(childPath => {
-        // Find the index of this path element in the allPaths array
-        // We need to compare by element identity, not just attributes
-        const pathIndex = allPaths.findIndex(p => p === childPath);
-        if (pathIndex !== -1) {
-          childStrokes.push(pathIndex + 1);
-        }
-      });
+      this.collectChildStrokes(groupEl, pathNumbers, childStrokes);
 
       groups.push({
         id,
@@ -219,6 +182,41 @@ export class SVGParser {
     return groups;
   }
 
+  /**
+   * Recursively collect stroke numbers of paths that are NOT inside nested
+   * radical group elements
+   */
+  private collectChildStrokes(
+    el: Element,
+    pathNumbers: Map<Element, number>,
+    childStrokes: number[]
+  ): void {
+    const children = el.children;
+    for (let i = 0; i < children.length; i++) {
+      const child = children[i];
+      const tagName = child.tagName;
+
+      if (tagName === 'path') {
+        // Stroke numbers follow path order in the document (lookup is by element identity)
+        const strokeNumber = pathNumbers.get(child);
+        if (strokeNumber !== undefined) {
+          childStrokes.push(strokeNumber);
+        }
+      } else if (
+        tagName === 'g' &&
+        (child.getAttribute('id') || '').includes('-g') &&
+        child.getAttribute('kvg:radical')
+      ) {
+        // This is a nested radical group - stop here, don't include its paths
+        // Paths inside nested radical groups belong to those groups, not this one
+        // Position groups (like g2, g3) only have kvg:position, not kvg:radical
+      } else {
+        // Position group, other non-radical group or other element type - continue traversing
+        this.collectChildStrokes(child, pathNumbers, childStrokes);
+      }
+    }
+  }
+
   /**
    * Determine radical information from groups
    */
@@ -292,21 +290,28 @@ export class SVGParser {
   }
 
   /**
-   * Check if a stroke belongs to a radical group
+   * Map stroke numbers to their (first) group ID and collect strokes that
+   * belong to a radical group
    */
-  private isRadicalStroke(stroke: StrokeData, groups: GroupData[]): boolean {
-    return groups.some(group => 
-      group.radical && 
-      group.childStrokes.includes(stroke.strokeNumber)
-    );
-  }
+  private indexStrokeGroups(groups: GroupData[]): {
+    groupIds: Map<number, string>;
+    radicalStrokes: Set<number>;
+  } {
+    const groupIds = new Map<number, string>();
+    const radicalStrokes = new Set<number>();
 
-  /**
-   * Get the group ID for a stroke
-   */
-  private getStrokeGroupId(strokeNumber: number, groups: GroupData[]): string | undefined {
-    const group = groups.find(g => g.childStrokes.includes(strokeNumber));
-    return group?.id;
+    groups.forEach(group => {
+      group.childStrokes.forEach(strokeNumber => {
+        if (!groupIds.has(strokeNumber)) {
+          groupIds.set(strokeNumber, group.id);
+        }
+        if (group.radical) {
+          radicalStrokes.add(strokeNumber);
+        }
+      });
+    });
+
+    return { groupIds, radicalStrokes };
   }
 
   /**
@@ -184,6 +184,14 @@ describe('KanjiVG', () => {
 
       await expect(kanjiVG.getRandom()).rejects.toThrow('No kanji available');
     });
+
+    it('should pick from the new index after setIndex', async () => {
+      kanjiVG.setIndex(new Map([['女', ['05973.svg']]]));
+      expect((await kanjiVG.getRandom()).character).toBe('女');
+
+      kanjiVG.setIndex(new Map([['好', ['0597d.svg']]]));
+      expect((await kanjiVG.getRandom()).character).toBe('好');
+    });
   });
 
   describe('searchRadical', () => {
@@ -0,0 +1,67 @@
+import { SVGParser } from '../SVGParser';
+
+describe('SVGParser', () => {
+  let parser: SVGParser;
+
+  // 好 with a nested radical group inside a position group, trimmed from the KanjiVG source
+  const svg = `<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg" xmlns:kvg="http://kanjivg.tagaini.net" width="109" height="109" viewBox="0 0 109 109">
+<g id="kvg:StrokePaths_0597d" style="fill:none;stroke:#000000;stroke-width:3;stroke-linecap:round;stroke-linejoin:round;">
+<g id="kvg:0597d" kvg:element="好">
+	<g id="kvg:0597d-g1" kvg:element="女" kvg:position="left" kvg:radical="general">
+		<path id="kvg:0597d-s1" kvg:type="㇛" d="M29.33,14.12c0.79,1.38,1.04,3.35,0.85,5.06"/>
+		<path id="kvg:0597d-s2" kvg:type="㇒" d="M41.12,35.88c0.5,1.4,0.71,2.83,0.35,4.75"/>
+		<path id="kvg:0597d-s3" kvg:type="㇀/㇐" d="M9.75,47.46c0.75,0.99,1.88,1.17,3.01,0.99"/>
+	</g>
+	<g id="kvg:0597d-g2" kvg:element="子" kvg:position="right">
+		<path id="kvg:0597d-s4" kvg:type="㇖" d="M52.68,20.3c1.69,0.45,3.74,0.51,5.21,0.34"/>
+		<g id="kvg:0597d-g3" kvg:element="一" kvg:radical="tradit">
+			<path id="kvg:0597d-s5" kvg:type="㇐" d="M46.03,52.68c1.46,0.61,5.04,0.84,7.65,0.42"/>
+		</g>
+	</g>
+</g>
+</g>
+<g id="kvg:StrokeNumbers_0597d" style="font-size:8;fill:#808080">
+	<text transform="matrix(1 0 0 1 22.50 14.50)">1</text>
+	<text transform="matrix(1 0 0 1 39.50 32.50)">2</text>
+	<text transform="matrix(1 0 0 1 1.99 47.98)">3</text>
+	<text transform="matrix(1 0 0 1 50.50 17.50)">4</text>
+	<text transform="matrix(1 0 0 1 47.50 50.50)">5</text>
+</g>
+</svg>`;
+
+  beforeEach(() => {
+    parser = new SVGParser();
+  });
+
+  it('should number strokes in document order', () => {
+    const result = parser.parseSVG(svg, '0597d');
+
+    expect(result.character).toBe('好');
+    expect(result.strokeCount).toBe(5);
+    expect(result.strokes.map(s => s.strokeNumber)).toEqual([1, 2, 3, 4, 5]);
+    expect(result.strokes[2].strokeType).toBe('㇀/㇐');
+    expect(result.strokes[4].numberPosition).toEqual({ x: 47.5, y: 50.5 });
+  });
+
+  it('should assign strokes to groups without crossing nested radical groups', () => {
+    const result = parser.parseSVG(svg, '0597d');
+    const byId = new Map(result.groups.map(g => [g.id, g]));
+
+    expect(byId.get('kvg:0597d-g1')?.childStrokes).toEqual([1, 2, 3]);
+    expect(byId.get('kvg:0597d-g2')?.childStrokes).toEqual([4]);
+    expect(byId.get('kvg:0597d-g3')?.childStrokes).toEqual([5]);
+
+    expect(result.strokes[3].isRadicalStroke).toBe(false);
+    expect(result.strokes[4].isRadicalStroke).toBe(true);
+    expect(result.strokes[4].groupId).toBe('kvg:0597d-g3');
+    expect(result.radicalInfo?.radical).toBe('女');
+  });
+
+  it('should return the cached result for a repeated unicode', () => {
+    const first = parser.parseSVG(svg, '0597d');
+    const second = parser.parseSVG(svg, '0597d');
+
+    expect(second).toBe(first);
+  });
+});